@@ -4,14 +4,40 @@ from __future__ import annotations
 
 import argparse
 import csv
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from string import Formatter
-from typing import Dict, Iterable, List, Sequence, Set
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
 
 UNIQUE_ID_COLUMN = "id"
 
+# (literal text, field name, conversion, format spec) for each template chunk.  A
+# format spec containing replacement fields, e.g. ``{amount:>{width}}``, is kept
+# as a nested program and rendered per row.
+TemplateProgram = List[Tuple[str, Optional[str], Optional[str], Union[str, "TemplateProgram"]]]
+# Same as TemplateProgram with field names resolved to CSV column indices.
+BoundProgram = List[Tuple[str, Optional[int], Optional[str], Union[str, "BoundProgram"]]]
+
+_CONVERSIONS = {"r": repr, "s": str, "a": ascii}
+
+# Formatter is stateless, so a single instance serves every parse.
+_FORMATTER = Formatter()
+
+# ASCII identifiers are sanitised in C via str.translate; anything that is not
+# alphanumeric, "-" or "_" becomes "_".
+_ASCII_FILENAME_TABLE = {
+    code: "_" for code in range(128) if not (chr(code).isalnum() or chr(code) in "-_")
+}
+
+# Read buffer for the merge CSV.
+_READ_BUFFER_SIZE = 1 << 20
+
+# Drafts are written as raw bytes, so newline translation happens up front.
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
 
 class MissingColumnError(Exception):
     """Raised when required CSV columns are missing."""
@@ -53,17 +79,19 @@ def load_template(template_path: Path) -> str:
         raise SystemExit(1) from exc
 
 
-def required_fields_from_template(template: str) -> Set[str]:
-    formatter = Formatter()
+@lru_cache(maxsize=16)
+def required_fields_from_template(template: str) -> FrozenSet[str]:
     fields: Set[str] = set()
-    for literal_text, field_name, format_spec, conversion in formatter.parse(template):
+    for literal_text, field_name, format_spec, conversion in _FORMATTER.parse(template):
         if field_name is None or field_name == "":
             continue
         if field_name.endswith("!r"):
             # Formatter.parse already splits conversion, but guard against malformed
             field_name = field_name[:-2]
         fields.add(field_name)
-    return fields
+        if format_spec and "{" in format_spec:
+            fields.update(required_fields_from_template(format_spec))
+    return frozenset(fields)
 
 
 def validate_columns(fieldnames: Sequence[str] | None, required_fields: Set[str]) -> None:
@@ -86,32 +114,94 @@ def sanitized_filename(identifier: str) -> str:
     safe_id = identifier.strip()
     if not safe_id:
         raise ValueError("Identifier is empty after stripping whitespace.")
-    sanitized = "".join(ch if ch.isalnum() or ch in {"-", "_"} else "_" for ch in safe_id)
+    if safe_id.isascii():
+        sanitized = safe_id.translate(_ASCII_FILENAME_TABLE)
+    else:
+        sanitized = "".join(ch if ch.isalnum() or ch in {"-", "_"} else "_" for ch in safe_id)
     return f"{sanitized}.txt"
 
 
-def gather_missing_fields(row: Dict[str, str], required_fields: Iterable[str]) -> List[str]:
+def gather_missing_fields(
+    row: Sequence[str], required_columns: Iterable[Tuple[str, int]]
+) -> List[str]:
     missing: List[str] = []
-    for field in required_fields:
-        value = row.get(field, "")
-        if value is None or str(value).strip() == "":
+    for field, column in required_columns:
+        if row[column].strip() == "":
             missing.append(field)
     return missing
 
 
-def render_template(template: str, row: Dict[str, str]) -> str:
-    class RowDict(dict):
-        def __missing__(self, key: str) -> str:  # pragma: no cover - defensive
-            raise KeyError(key)
+def compile_template(template: str) -> TemplateProgram:
+    """Parse ``template`` once so rows can be rendered without re-parsing it."""
+
+    return [
+        (literal_text, field_name, conversion, _compile_format_spec(format_spec))
+        for literal_text, field_name, format_spec, conversion in _FORMATTER.parse(template)
+    ]
+
+
+def _compile_format_spec(format_spec: Optional[str]) -> Union[str, TemplateProgram]:
+    if format_spec and "{" in format_spec:
+        return compile_template(format_spec)
+    return format_spec or ""
 
-    return template.format_map(RowDict(row))
+
+def bind_template(program: TemplateProgram, column_index: Dict[str, int]) -> BoundProgram:
+    """Resolve the placeholders in ``program`` to positions in the CSV header."""
+
+    bound: BoundProgram = []
+    for literal_text, field_name, conversion, format_spec in program:
+        column = None
+        if field_name is not None:
+            if field_name not in column_index:
+                raise MissingColumnError(
+                    f"Template placeholder '{{{field_name}}}' does not match a CSV column."
+                )
+            column = column_index[field_name]
+        if isinstance(format_spec, list):
+            format_spec = bind_template(format_spec, column_index)
+        bound.append((literal_text, column, conversion, format_spec))
+    return bound
+
+
+def render_compiled(program: BoundProgram, row: Sequence[str]) -> str:
+    parts: List[str] = []
+    append = parts.append
+    for literal_text, column, conversion, format_spec in program:
+        append(literal_text)
+        if column is None:
+            continue
+        value = row[column]
+        if conversion:
+            value = _CONVERSIONS[conversion](value)
+        if isinstance(format_spec, list):
+            format_spec = render_compiled(format_spec, row)
+        if format_spec:
+            value = format(value, format_spec)
+        append(value)
+    return "".join(parts)
+
+
+def write_draft(output_path: Path, content: str) -> None:
+    """Write ``content`` to ``output_path`` with one open/write/close sequence."""
+
+    if os.linesep != "\n":
+        content = content.replace("\n", os.linesep)
+    payload = memoryview(content.encode("utf-8"))
+    fd = os.open(output_path, _WRITE_FLAGS, 0o666)  # umask applies, as with write_text
+    try:
+        while payload:
+            payload = payload[os.write(fd, payload):]
+    finally:
+        os.close(fd)
 
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = parse_args(argv)
 
     template = load_template(args.template)
-    required_fields = required_fields_from_template(template)
+    program = compile_template(template)
+    required_fields = set(required_fields_from_template(template))
     required_fields.add(UNIQUE_ID_COLUMN)
 
     args.output_dir.mkdir(parents=True, exist_ok=True)
@@ -120,26 +210,39 @@ def main(argv: Sequence[str] | None = None) -> int:
     skipped: Dict[str, List[str]] = {}
 
     try:
-        with args.csv.open(newline="", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            validate_columns(reader.fieldnames, required_fields)
-
-            for index, row in enumerate(reader, start=2):  # start=2 to reflect CSV line
-                identifier = row.get(UNIQUE_ID_COLUMN, "").strip()
+        with args.csv.open(newline="", encoding="utf-8", buffering=_READ_BUFFER_SIZE) as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, None)
+            validate_columns(header, required_fields)
+
+            column_index = {name: column for column, name in enumerate(header)}
+            bound_program = bind_template(program, column_index)
+            required_columns = tuple((field, column_index[field]) for field in required_fields)
+            required_indices = tuple(column for _, column in required_columns)
+            id_column = column_index[UNIQUE_ID_COLUMN]
+            width = len(header)
+
+            rows = (row for row in reader if row)  # ignore blank lines
+            for index, row in enumerate(rows, start=2):  # start=2 to reflect CSV line
+                if len(row) < width:
+                    row.extend([""] * (width - len(row)))
+
+                identifier = row[id_column].strip()
                 if not identifier:
                     skipped[f"<row {index}>"] = [UNIQUE_ID_COLUMN]
                     continue
 
-                missing_fields = gather_missing_fields(row, required_fields)
-                if missing_fields:
-                    skipped[identifier] = missing_fields
+                complete = True
+                for column in required_indices:
+                    value = row[column]
+                    if not value or value.isspace():
+                        complete = False
+                        break
+                if not complete:
+                    skipped[identifier] = gather_missing_fields(row, required_columns)
                     continue
 
-                try:
-                    content = render_template(template, row)
-                except KeyError as exc:
-                    skipped[identifier] = [str(exc)]
-                    continue
+                content = render_compiled(bound_program, row)
 
                 try:
                     filename = sanitized_filename(identifier)
@@ -148,7 +251,7 @@ def main(argv: Sequence[str] | None = None) -> int:
                     continue
 
                 output_path = args.output_dir / filename
-                output_path.write_text(content, encoding="utf-8")
+                write_draft(output_path, content)
                 generated.append(str(output_path))
     except MissingColumnError as exc:
         print(f"Error: {exc}", file=sys.stderr)
@@ -17,8 +17,16 @@ _REORDER_POINT_KEY = "reorderpoint"
 _REQUIRED_COLUMNS = {_ITEM_KEY, _ON_HAND_KEY, _REORDER_POINT_KEY}
 _OPTIONAL_COLUMNS = {"vendor", "category", "sku", "description"}
 
+# Buffer sizes for reading snapshots and writing exports.
+_READ_BUFFER_SIZE = 1 << 20
+_WRITE_BUFFER_SIZE = 1 << 20
 
-@dataclass(frozen=True)
+# Slotted records drop the per-instance __dict__ on large snapshots. The
+# ``slots`` flag needs Python 3.10+, so older interpreters keep plain classes.
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class InventoryRecord:
     """Typed representation of a row in the inventory snapshot."""
 
@@ -43,7 +51,7 @@ class InventoryRecord:
         return self.shortage / self.reorder_point
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class SummaryRow:
     """Row for the rendered output table."""
 
@@ -126,7 +134,9 @@ def _load_inventory(csv_path: Path) -> Tuple[List[InventoryRecord], List[str]]:
     if not csv_path.exists():
         raise FileNotFoundError(f"Inventory file not found: {csv_path}")
 
-    with csv_path.open(newline="", encoding="utf-8-sig") as handle:
+    with csv_path.open(
+        newline="", encoding="utf-8-sig", buffering=_READ_BUFFER_SIZE
+    ) as handle:
         reader = csv.DictReader(handle)
         fieldnames = reader.fieldnames or []
         header_lookup = { _normalise_header(name): name for name in fieldnames }
@@ -201,6 +211,8 @@ def _filter_records(
 ) -> List[InventoryRecord]:
     vendor_set = {vendor.lower() for vendor in vendors if vendor}
     category_set = {category.lower() for category in categories if category}
+    if not vendor_set and not category_set:
+        return records if isinstance(records, list) else list(records)
 
     filtered: List[InventoryRecord] = []
     for record in records:
@@ -217,17 +229,21 @@ def _filter_records(
 def _build_summary(records: Iterable[InventoryRecord]) -> List[SummaryRow]:
     summary_rows: List[SummaryRow] = []
     for record in records:
-        if record.shortage <= 0:
+        # Compute the shortage once per record rather than through the
+        # properties, which would re-derive it for the severity ratio too.
+        shortage = record.shortage
+        if shortage <= 0:
             continue
+        reorder_point = record.reorder_point
         summary_rows.append(
             SummaryRow(
                 item=record.item,
                 vendor=_format_optional(record.vendor),
                 category=_format_optional(record.category),
                 on_hand=record.on_hand,
-                reorder_point=record.reorder_point,
-                shortage=record.shortage,
-                severity_ratio=record.severity_ratio,
+                reorder_point=reorder_point,
+                shortage=shortage,
+                severity_ratio=shortage / reorder_point if reorder_point else float("inf"),
             )
         )
 
@@ -252,33 +268,37 @@ def _format_table(rows: Sequence[SummaryRow]) -> str:
         "Severity",
     )
 
-    data = [headers]
+    # Track column widths while stringifying so each cell is formatted once.
+    widths = [len(header) for header in headers]
+    data: List[Tuple[str, ...]] = []
     for row in rows:
         severity_display = (
             "∞" if row.severity_ratio == float("inf") else f"{row.severity_ratio * 100:.0f}%"
         )
-        data.append(
-            (
-                row.item,
-                row.vendor,
-                row.category,
-                _format_quantity(row.on_hand),
-                _format_quantity(row.reorder_point),
-                _format_quantity(row.shortage),
-                severity_display,
-            )
+        cells = (
+            row.item,
+            row.vendor,
+            row.category,
+            _format_quantity(row.on_hand),
+            _format_quantity(row.reorder_point),
+            _format_quantity(row.shortage),
+            severity_display,
         )
+        for i, cell in enumerate(cells):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+        data.append(cells)
 
-    widths = [max(len(str(item[i])) for item in data) for i in range(len(headers))]
+    row_format = " | ".join("{:<" + str(width) + "}" for width in widths)
 
     lines: List[str] = []
-    header_line = " | ".join(str(headers[i]).ljust(widths[i]) for i in range(len(headers)))
+    header_line = row_format.format(*headers)
     separator = "-+-".join("-" * widths[i] for i in range(len(headers)))
     lines.append(header_line)
     lines.append(separator)
 
-    for row in data[1:]:
-        lines.append(" | ".join(str(row[i]).ljust(widths[i]) for i in range(len(headers))))
+    for row in data:
+        lines.append(row_format.format(*row))
 
     return "\n".join(lines)
 
@@ -297,43 +317,49 @@ def _export_summary(path: Path, rows: Sequence[SummaryRow]) -> None:
     )
 
     if suffix == ".csv":
-        with path.open("w", newline="", encoding="utf-8") as handle:
-            writer = csv.writer(handle)
-            writer.writerow(headers)
+        def csv_rows() -> Iterable[Tuple[str, ...]]:
             for row in rows:
                 severity_display = (
                     "inf" if row.severity_ratio == float("inf") else f"{row.severity_ratio:.4f}"
                 )
-                writer.writerow(
-                    [
-                        row.item,
-                        row.vendor,
-                        row.category,
-                        _format_quantity(row.on_hand),
-                        _format_quantity(row.reorder_point),
-                        _format_quantity(row.shortage),
-                        severity_display,
-                    ]
+                yield (
+                    row.item,
+                    row.vendor,
+                    row.category,
+                    _format_quantity(row.on_hand),
+                    _format_quantity(row.reorder_point),
+                    _format_quantity(row.shortage),
+                    severity_display,
                 )
+
+        with path.open(
+            "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+        ) as handle:
+            writer = csv.writer(handle)
+            writer.writerow(headers)
+            writer.writerows(csv_rows())
     elif suffix in {".md", ".markdown"}:
-        with path.open("w", encoding="utf-8") as handle:
-            handle.write("| Item | Vendor | Category | On Hand | Reorder Point | Shortage | Severity |\n")
-            handle.write("|------|--------|----------|---------|---------------|----------|----------|\n")
-            for row in rows:
-                severity_display = (
-                    "∞" if row.severity_ratio == float("inf") else f"{row.severity_ratio * 100:.0f}%"
-                )
-                handle.write(
-                    "| {item} | {vendor} | {category} | {on_hand} | {reorder} | {shortage} | {severity} |\n".format(
-                        item=row.item,
-                        vendor=row.vendor,
-                        category=row.category,
-                        on_hand=_format_quantity(row.on_hand),
-                        reorder=_format_quantity(row.reorder_point),
-                        shortage=_format_quantity(row.shortage),
-                        severity=severity_display,
-                    )
+        lines = [
+            "| Item | Vendor | Category | On Hand | Reorder Point | Shortage | Severity |\n",
+            "|------|--------|----------|---------|---------------|----------|----------|\n",
+        ]
+        for row in rows:
+            severity_display = (
+                "∞" if row.severity_ratio == float("inf") else f"{row.severity_ratio * 100:.0f}%"
+            )
+            lines.append(
+                "| {item} | {vendor} | {category} | {on_hand} | {reorder} | {shortage} | {severity} |\n".format(
+                    item=row.item,
+                    vendor=row.vendor,
+                    category=row.category,
+                    on_hand=_format_quantity(row.on_hand),
+                    reorder=_format_quantity(row.reorder_point),
+                    shortage=_format_quantity(row.shortage),
+                    severity=severity_display,
                 )
+            )
+        with path.open("w", encoding="utf-8") as handle:
+            handle.write("".join(lines))
     else:
         raise ValueError(
             "Unsupported export format. Use a .csv or .md/.markdown extension."
@@ -1,4 +1,4 @@
-import os, time
+import os, shutil, subprocess, time
 
 # >>> PATH TO FILE <<<
 PDF_FOLDER = r"C:\Users\dalexander\Downloads\SS  DC ASSH-20250925T152902Z-1-001\SS  DC ASSH"
@@ -8,17 +8,24 @@ MAX_RETRIES = 2            # retry per file if the print verb throws
 LOG_FILE = os.path.join(PDF_FOLDER, "_printed.log")
 DRY_RUN = False            # set True to test without actually printing
 
+# SumatraPDF prints a whole batch from one process instead of launching the
+# viewer per file; os.startfile is used when it isn't installed.
+SUMATRA_PDF = r"C:\Program Files\SumatraPDF\SumatraPDF.exe"
+BATCH_SIZE = 50            # PDFs handed to SumatraPDF per print command
+BATCH_TIMEOUT = 600        # seconds to wait for one SumatraPDF batch before giving up
+
 # Load already-printed filenames (resume-safe)
 printed = set()
 if os.path.exists(LOG_FILE):
     with open(LOG_FILE, "r", encoding="utf-8") as f:
         printed = {line.strip() for line in f if line.strip()}
 
-# Collect PDFs (top-level only) and sort
-pdfs = sorted(
-    f for f in os.listdir(PDF_FOLDER)
-    if f.lower().endswith(".pdf") and os.path.isfile(os.path.join(PDF_FOLDER, f))
-)
+# Compare case-insensitively so a renamed "X.PDF" isn't reprinted
+printed_lower = {n.lower() for n in printed}
+
+# Collect PDFs (top-level only) and sort; scandir's cached file type avoids a stat per entry
+with os.scandir(PDF_FOLDER) as it:
+    pdfs = sorted(e.name for e in it if e.is_file() and e.name.lower().endswith(".pdf"))
 
 total = len(pdfs)
 print(f"Found {total} PDFs in: {PDF_FOLDER}")
@@ -26,33 +33,74 @@ print(f"Found {total} PDFs in: {PDF_FOLDER}")
 def print_once(path: str):
     os.startfile(path, "print")  # uses the default PDF app’s print verb
 
-for idx, name in enumerate(pdfs, 1):
-    if name in printed:
-        print(f"[skip] {name} (already logged)")
-        continue
-
-    full = os.path.join(PDF_FOLDER, name)
-    print(f"[{idx}/{total}] Printing: {full}")
-
-    if DRY_RUN:
-        time.sleep(0.2)
-        continue
+def print_batch(paths: list):
+    # SumatraPDF queues every job itself, so no delay is needed between batches
+    subprocess.run(
+        [sumatra, "-print-to-default", "-silent", *paths], check=True, timeout=BATCH_TIMEOUT
+    )
 
+def print_with_retries(name: str, full: str):
     attempt = 0
     while True:
         try:
             attempt += 1
             print_once(full)
             time.sleep(DELAY_SECONDS)  # give spooler time
-            with open(LOG_FILE, "a", encoding="utf-8") as f:
-                f.write(name + "\n")
-            break
+            log_fh.write(name + "\n")
+            return
         except OSError as e:
             print(f"[warn] Attempt {attempt} failed for {name}: {e}")
             if attempt <= MAX_RETRIES:
                 time.sleep(DELAY_SECONDS * 2)
                 continue
             print(f"[error] Skipping {name} after {MAX_RETRIES} retries.")
-            break
+            return
+
+sumatra = shutil.which("SumatraPDF") or (SUMATRA_PDF if os.path.isfile(SUMATRA_PDF) else None)
+if sumatra:
+    print(f"Batch printing with: {sumatra}")
+
+# One line-buffered handle for the whole run: each entry is flushed as it is
+# written (resume-safe) without reopening the log for every file.
+log_fh = None if DRY_RUN else open(LOG_FILE, "a", buffering=1, encoding="utf-8")
+try:
+    batch_queue = []
+    for idx, name in enumerate(pdfs, 1):
+        if name.lower() in printed_lower:
+            print(f"[skip] {name} (already logged)")
+            continue
+
+        full = os.path.join(PDF_FOLDER, name)
+        print(f"[{idx}/{total}] {'Queued' if sumatra else 'Printing'}: {full}")
+
+        if DRY_RUN:
+            time.sleep(0.2)
+            continue
+
+        if sumatra:
+            batch_queue.append((name, full))
+            continue
+
+        print_with_retries(name, full)
+
+    for start in range(0, len(batch_queue), BATCH_SIZE):
+        batch = batch_queue[start:start + BATCH_SIZE]
+        print(f"Printing batch of {len(batch)} starting at {batch[0][0]}")
+        try:
+            print_batch([full for _, full in batch])
+        except (OSError, subprocess.SubprocessError) as e:
+            # Fall back to one print verb per file so a single bad PDF is skipped
+            # after MAX_RETRIES instead of holding its whole batch out of the log.
+            # Files the batch already printed may come out twice.
+            print(f"[error] Batch starting at {batch[0][0]} failed: {e}")
+            print("Falling back to one print verb per file for this batch")
+            for name, full in batch:
+                print(f"Printing: {full}")
+                print_with_retries(name, full)
+            continue
+        log_fh.write("".join(name + "\n" for name, _ in batch))
+finally:
+    if log_fh is not None:
+        log_fh.close()
 
 print("Done.")
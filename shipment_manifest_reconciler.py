@@ -11,14 +11,25 @@ import csv
 import sys
 from collections import Counter
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
 from typing import Iterable, List, Tuple
 
 REQUIRED_COLUMNS = {"order_id", "sku", "quantity"}
+# 1 MiB buffers for manifest reads and result exports.
+_READ_BUFFER_SIZE = 1 << 20
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# One format call per Markdown row instead of stringifying and joining cells.
+MARKDOWN_ROW_FORMAT = " | ".join(["{}"] * 7) + "\n"
+_row_values = attrgetter("order_id", "sku", "expected", "scanned", "matched", "short", "overage")
 
 
 @dataclass
 class ReconciliationRow:
+    # Explicit slots (no per-row __dict__) keep large reconciliations compact.
+    __slots__ = ("order_id", "sku", "expected", "scanned", "matched", "short", "overage")
+
     order_id: str
     sku: str
     expected: int
@@ -60,20 +71,30 @@ def load_manifest(path: Path) -> Counter[Tuple[str, str]]:
         raise FileNotFoundError(f"Manifest file not found: {path}")
 
     counter: Counter[Tuple[str, str]] = Counter()
-    with path.open(newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        missing_columns = REQUIRED_COLUMNS - set(reader.fieldnames or [])
+    with path.open(newline="", encoding="utf-8", buffering=_READ_BUFFER_SIZE) as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None) or []
+        missing_columns = REQUIRED_COLUMNS - set(header)
         if missing_columns:
             raise ValueError(
                 f"CSV file {path} is missing required columns: {', '.join(sorted(missing_columns))}"
             )
 
-        for line_number, row in enumerate(reader, start=2):
+        column_index = {name: index for index, name in enumerate(header)}
+        order_column = column_index["order_id"]
+        sku_column = column_index["sku"]
+        quantity_column = column_index["quantity"]
+
+        # Interning shares one string object per distinct order ID / SKU across
+        # every key (and across both manifests) instead of one copy per row.
+        intern = sys.intern
+        rows = (row for row in reader if row)  # blank lines hold no entries
+        for line_number, row in enumerate(rows, start=2):
             try:
-                order_id = row["order_id"].strip()
-                sku = row["sku"].strip()
-                quantity = int(row["quantity"].strip())
-            except (AttributeError, ValueError) as exc:
+                order_id = intern(row[order_column].strip())
+                sku = intern(row[sku_column].strip())
+                quantity = int(row[quantity_column])  # int() ignores surrounding whitespace
+            except (IndexError, ValueError) as exc:
                 raise ValueError(
                     f"Invalid data at {path}:{line_number}. Expected non-empty order_id, sku, and integer quantity."
                 ) from exc
@@ -86,19 +107,29 @@ def load_manifest(path: Path) -> Counter[Tuple[str, str]]:
 
 
 def reconcile(expected: Counter[Tuple[str, str]], scanned: Counter[Tuple[str, str]]) -> List[ReconciliationRow]:
+    # Same arithmetic as ReconciliationRow.from_counts, inlined because this
+    # loop runs once per (order_id, sku) key.
     rows: List[ReconciliationRow] = []
-    for key in sorted(set(expected) | set(scanned)):
-        rows.append(
-            ReconciliationRow.from_counts(
-                key,
-                expected=expected.get(key, 0),
-                scanned=scanned.get(key, 0),
+    append = rows.append
+    expected_get = expected.get
+    scanned_get = scanned.get
+    for key in sorted(expected.keys() | scanned.keys()):
+        expected_qty = expected_get(key, 0)
+        scanned_qty = scanned_get(key, 0)
+        difference = expected_qty - scanned_qty
+        short = difference if difference > 0 else 0
+        overage = -difference if difference < 0 else 0
+        append(
+            ReconciliationRow(
+                key[0], key[1], expected_qty, scanned_qty, expected_qty - short, short, overage
             )
         )
     return rows
 
 
-def render_table(rows: List[ReconciliationRow]) -> str:
+def render_table(rows: List[ReconciliationRow]) -> Tuple[str, bool]:
+    """Return the rendered table and whether any row is short or over."""
+
     headers = [
         "Order ID",
         "SKU",
@@ -108,110 +139,70 @@ def render_table(rows: List[ReconciliationRow]) -> str:
         "Short",
         "Overage",
     ]
-    data = [
-        [
-            row.order_id,
-            row.sku,
-            str(row.expected),
-            str(row.scanned),
-            str(row.matched),
-            str(row.short),
-            str(row.overage),
-        ]
-        for row in rows
-    ]
-
-    totals = [
-        "TOTAL",
-        "",
-        str(sum(row.expected for row in rows)),
-        str(sum(row.scanned for row in rows)),
-        str(sum(row.matched for row in rows)),
-        str(sum(row.short for row in rows)),
-        str(sum(row.overage for row in rows)),
-    ]
-    data.append(totals)
-
+    # Single pass: accumulate totals, stringify cells and track widths together.
+    totals = [0, 0, 0, 0, 0]
     column_widths = [len(header) for header in headers]
-    for row in data:
-        for idx, cell in enumerate(row):
-            column_widths[idx] = max(column_widths[idx], len(cell))
+    data: List[List[str]] = []
+    for row in rows:
+        quantities = (row.expected, row.scanned, row.matched, row.short, row.overage)
+        cells = [row.order_id, row.sku]
+        for idx, quantity in enumerate(quantities):
+            totals[idx] += quantity
+            cells.append(str(quantity))
+        for idx, cell in enumerate(cells):
+            if len(cell) > column_widths[idx]:
+                column_widths[idx] = len(cell)
+        data.append(cells)
+
+    total_cells = ["TOTAL", ""] + [str(total) for total in totals]
+    for idx, cell in enumerate(total_cells):
+        column_widths[idx] = max(column_widths[idx], len(cell))
+    data.append(total_cells)
+
+    row_format = " | ".join("{:<" + str(width) + "}" for width in column_widths)
 
     def format_row(row_values: List[str]) -> str:
-        return " | ".join(cell.ljust(column_widths[idx]) for idx, cell in enumerate(row_values))
+        return row_format.format(*row_values)
 
     divider = "-+-".join("-" * width for width in column_widths)
     lines = [format_row(headers), divider]
     for row in data:
         lines.append(format_row(row))
-    return "\n".join(lines)
+    # Short and overage counts are never negative, so non-zero totals mean at
+    # least one row has a discrepancy.
+    has_discrepancy = totals[3] > 0 or totals[4] > 0
+    return "\n".join(lines), has_discrepancy
 
 
 def export_results(path: Path, rows: List[ReconciliationRow]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
     headers = ["order_id", "sku", "expected", "scanned", "matched", "short", "overage"]
-    with path.open("w", newline="", encoding="utf-8") as handle:
+    # Totals are accumulated while writing the CSV and reused for the Markdown.
+    totals = [0, 0, 0, 0, 0]
+
+    def csv_rows() -> Iterable[Tuple[object, ...]]:
+        for row in rows:
+            quantities = (row.expected, row.scanned, row.matched, row.short, row.overage)
+            for idx, quantity in enumerate(quantities):
+                totals[idx] += quantity
+            yield (row.order_id, row.sku, *quantities)
+
+    with path.open("w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as handle:
         writer = csv.writer(handle)
         writer.writerow(headers)
-        for row in rows:
-            writer.writerow(
-                [
-                    row.order_id,
-                    row.sku,
-                    row.expected,
-                    row.scanned,
-                    row.matched,
-                    row.short,
-                    row.overage,
-                ]
-            )
-        writer.writerow(
-            [
-                "TOTAL",
-                "",
-                sum(row.expected for row in rows),
-                sum(row.scanned for row in rows),
-                sum(row.matched for row in rows),
-                sum(row.short for row in rows),
-                sum(row.overage for row in rows),
-            ]
-        )
+        writer.writerows(csv_rows())
+        writer.writerow(["TOTAL", "", *totals])
 
     markdown_path = path.with_suffix(".md")
+    lines = [
+        " | ".join(h.title() for h in headers) + "\n",
+        " | ".join(["---"] * len(headers)) + "\n",
+    ]
+    lines.extend(MARKDOWN_ROW_FORMAT.format(*_row_values(row)) for row in rows)
+    lines.append(" | ".join(["TOTAL", "", *(str(total) for total in totals)]))
     with markdown_path.open("w", encoding="utf-8") as handle:
-        headers_line = " | ".join(h.title() for h in headers)
-        separator_line = " | ".join(["---"] * len(headers))
-        handle.write(f"{headers_line}\n")
-        handle.write(f"{separator_line}\n")
-        for row in rows:
-            handle.write(
-                " | ".join(
-                    [
-                        row.order_id,
-                        row.sku,
-                        str(row.expected),
-                        str(row.scanned),
-                        str(row.matched),
-                        str(row.short),
-                        str(row.overage),
-                    ]
-                )
-                + "\n"
-            )
-        handle.write(
-            " | ".join(
-                [
-                    "TOTAL",
-                    "",
-                    str(sum(row.expected for row in rows)),
-                    str(sum(row.scanned for row in rows)),
-                    str(sum(row.matched for row in rows)),
-                    str(sum(row.short for row in rows)),
-                    str(sum(row.overage for row in rows)),
-                ]
-            )
-        )
+        handle.write("".join(lines))
 
 
 def main(argv: Iterable[str]) -> int:
@@ -225,7 +216,7 @@ def main(argv: Iterable[str]) -> int:
         return 1
 
     rows = reconcile(expected_counts, scanned_counts)
-    table = render_table(rows)
+    table, has_discrepancy = render_table(rows)
     print(table)
 
     if args.export:
@@ -235,7 +226,6 @@ def main(argv: Iterable[str]) -> int:
             print(f"Failed to export results: {exc}", file=sys.stderr)
             return 1
 
-    has_discrepancy = any(row.short > 0 or row.overage > 0 for row in rows)
     return 0 if not has_discrepancy else 2
 
 
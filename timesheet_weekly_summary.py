@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import argparse
 import csv
+import re
 import sys
 from collections import defaultdict
 from dataclasses import dataclass
@@ -29,6 +30,28 @@ _DATE_FORMATS: Tuple[str, ...] = (
     "%m-%d-%Y",
 )
 
+# Regex equivalents of the strptime directives used above. Matching these
+# precompiled patterns avoids strptime's per-call parsing and locale setup.
+_DATE_DIRECTIVES = {
+    "%Y": r"(?P<year>\d\d\d\d)",
+    "%m": r"(?P<month>1[0-2]|0[1-9]|[1-9])",
+    "%d": r"(?P<day>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])",
+}
+
+
+def _compile_date_format(fmt: str) -> re.Pattern[str]:
+    pattern = re.escape(fmt)
+    for directive, group in _DATE_DIRECTIVES.items():
+        pattern = pattern.replace(directive, group)
+    return re.compile(pattern)
+
+
+# Kept in _DATE_FORMATS order so ambiguous dates resolve exactly as before.
+_DATE_PATTERNS = tuple(_compile_date_format(fmt) for fmt in _DATE_FORMATS)
+
+_READ_BUFFER_SIZE = 1 << 20  # timesheet CSV input
+_WRITE_BUFFER_SIZE = 1 << 20  # CSV/Markdown exports
+
 
 @dataclass(frozen=True)
 class SummaryRow:
@@ -93,9 +116,12 @@ def _parse_date(raw_value: str, row_number: int) -> date:
     except ValueError:
         pass
 
-    for fmt in _DATE_FORMATS:
+    for pattern in _DATE_PATTERNS:
+        match = pattern.fullmatch(value)
+        if match is None:
+            continue
         try:
-            return datetime.strptime(value, fmt).date()
+            return date(int(match["year"]), int(match["month"]), int(match["day"]))
         except ValueError:
             continue
 
@@ -137,13 +163,16 @@ def _load_timesheet(
     if not csv_path.exists():
         raise FileNotFoundError(f"Timesheet file not found: {csv_path}")
 
-    with csv_path.open(newline="", encoding="utf-8-sig") as handle:
-        reader = csv.DictReader(handle)
+    with csv_path.open(
+        newline="", encoding="utf-8-sig", buffering=_READ_BUFFER_SIZE
+    ) as handle:
+        reader = csv.reader(handle)
+        fieldnames = next(reader, None) or []
 
         missing_columns = {
             column
             for column in (date_col, project_col, hours_col)
-            if column not in reader.fieldnames if reader.fieldnames
+            if column not in fieldnames if fieldnames
         }
         if missing_columns:
             raise KeyError(
@@ -151,17 +180,36 @@ def _load_timesheet(
                 + ", ".join(sorted(missing_columns))
             )
 
-        for index, row in enumerate(reader, start=2):  # header is row 1
+        if not fieldnames:
+            return [], messages
+
+        # Resolve the columns once.
+        column_index = {name: position for position, name in enumerate(fieldnames)}
+        date_index = column_index[date_col]
+        project_index = column_index[project_col]
+        hours_index = column_index[hours_col]
+        width = len(fieldnames)
+        # Timesheets repeat the same dates many times; parse each distinct raw
+        # value (and compute its ISO week) once.
+        week_cache: Dict[str, Tuple[int, int]] = {}
+
+        rows = (row for row in reader if row)
+        for index, row in enumerate(rows, start=2):  # header is row 1
+            if len(row) < width:
+                row.extend([""] * (width - len(row)))
+            raw_date = row[date_index]
+            week = week_cache.get(raw_date)
             try:
-                entry_date = _parse_date(row.get(date_col, ""), index)
-                hours = _parse_hours(row.get(hours_col, ""), index)
+                if week is None:
+                    week = _parse_date(raw_date, index).isocalendar()[:2]
+                    week_cache[raw_date] = week
+                hours = _parse_hours(row[hours_index], index)
             except ValueError as err:
                 messages.append(str(err))
                 continue
 
-            project = (row.get(project_col) or "Unspecified").strip() or "Unspecified"
-            iso_year, iso_week, _ = entry_date.isocalendar()
-            key = (iso_year, iso_week, project)
+            project = row[project_index].strip() or "Unspecified"
+            key = (week[0], week[1], project)
             totals[key] += hours
 
     summary_rows = [
@@ -183,14 +231,16 @@ def _format_table(rows: Iterable[SummaryRow]) -> str:
 
     widths = [max(len(str(item[i])) for item in data) for i in range(len(headers))]
 
+    row_format = " | ".join("{:<" + str(width) + "}" for width in widths)
+
     lines = []
-    header_line = " | ".join(str(headers[i]).ljust(widths[i]) for i in range(len(headers)))
+    header_line = row_format.format(*headers)
     separator = "-+-".join("-" * widths[i] for i in range(len(headers)))
     lines.append(header_line)
     lines.append(separator)
 
     for row in data[1:]:
-        lines.append(" | ".join(str(row[i]).ljust(widths[i]) for i in range(len(headers))))
+        lines.append(row_format.format(*row))
 
     return "\n".join(lines)
 
@@ -201,19 +251,24 @@ def _export_summary(path: Path, rows: Iterable[SummaryRow]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     suffix = path.suffix.lower()
     if suffix == ".csv":
-        with path.open("w", newline="", encoding="utf-8") as handle:
+        with path.open(
+            "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+        ) as handle:
             writer = csv.writer(handle)
             writer.writerow(["ISO Week", "Project/Client", "Total Hours"])
-            for row in rows:
-                writer.writerow([row.iso_week, row.project, f"{row.hours:.2f}"])
+            writer.writerows(
+                (row.iso_week, row.project, f"{row.hours:.2f}") for row in rows
+            )
     elif suffix in {".md", ".markdown"}:
+        lines = [
+            "| ISO Week | Project/Client | Total Hours |\n",
+            "|----------|----------------|-------------|\n",
+        ]
+        lines.extend(
+            f"| {row.iso_week} | {row.project} | {row.hours:.2f} |\n" for row in rows
+        )
         with path.open("w", encoding="utf-8") as handle:
-            handle.write("| ISO Week | Project/Client | Total Hours |\n")
-            handle.write("|----------|----------------|-------------|\n")
-            for row in rows:
-                handle.write(
-                    f"| {row.iso_week} | {row.project} | {row.hours:.2f} |\n"
-                )
+            handle.write("".join(lines))
     else:
         raise ValueError(
             "Unsupported export format. Use a .csv or .md/.markdown extension."
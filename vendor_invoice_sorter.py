@@ -9,16 +9,26 @@ actually touching the filesystem.
 from __future__ import annotations
 
 import argparse
+import os
 import re
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Iterator
+from typing import Dict, Iterable, Iterator, List
 
 SOURCE_DIR = Path("SOURCE_DIR")
 DESTINATION_ROOT = Path("DESTINATION_ROOT")
 
 VENDOR_PATTERN = re.compile(r"^(?P<vendor>[A-Za-z0-9]+)[_-].+")
+# Lower-cased suffixes accepted as invoices; a tuple lets str.endswith test all at once.
+INVOICE_SUFFIXES = (".pdf",)
+# Progress lines are buffered and written to stdout in batches of this size.
+LOG_FLUSH_LINES = 1024
+# Moves are I/O-bound renames, so a few threads keep the filesystem busy.
+MOVE_WORKERS = min(8, (os.cpu_count() or 1) * 2)
 
 
 @dataclass(frozen=True)
@@ -34,35 +44,99 @@ class Invoice:
         invoice is categorized under ``unknown``.
         """
 
-        match = VENDOR_PATTERN.match(self.path.name)
-        if not match:
-            return "unknown"
-        return match.group("vendor").lower()
+        return _infer_vendor(self.path.name)
 
 
-def iter_invoices(source_dir: Path) -> Iterator[Invoice]:
-    """Yield invoices discovered in ``source_dir``."""
+@lru_cache(maxsize=4096)
+def _infer_vendor(filename: str) -> str:
+    match = VENDOR_PATTERN.match(filename)
+    if not match:
+        return "unknown"
+    return match.group("vendor").lower()
 
-    yield from (Invoice(path) for path in sorted(source_dir.glob("*.pdf")))
 
+def iter_invoices(source_dir: Path) -> Iterator[Invoice]:
+    """Yield invoices discovered in ``source_dir``."""
 
-def move_invoice(invoice: Invoice, destination: Path, dry_run: bool) -> None:
+    # scandir reuses the file type from the directory listing, so filtering
+    # regular files costs no extra stat() per entry.
+    with os.scandir(source_dir) as entries:
+        names = sorted(
+            entry.name
+            for entry in entries
+            if entry.name.lower().endswith(INVOICE_SUFFIXES) and entry.is_file()
+        )
+    yield from (Invoice(source_dir / name) for name in names)
+
+
+def move_invoice(
+    invoice: Invoice,
+    destination: Path,
+    dry_run: bool,
+    create_destination: bool = True,
+) -> str:
     """Move ``invoice`` into ``destination`` when not running a dry-run.
 
     The destination directory is only created when ``dry_run`` is ``False`` so
     that preview runs do not leave any traces on disk.  In dry-run mode the
-    function simply prints the action that *would* be performed.
+    function only describes the action that *would* be performed.  Callers that
+    have already created ``destination`` can pass ``create_destination=False``
+    to skip the ``mkdir`` call.  Returns the log line for the caller to print.
     """
 
     destination = destination / invoice.path.name
 
     if dry_run:
-        print(f"[DRY-RUN] Would move {invoice.path} -> {destination}")
-        return
+        return f"[DRY-RUN] Would move {invoice.path} -> {destination}"
+
+    if create_destination:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        # A same-filesystem move is a single rename; skip shutil.move's probes.
+        os.replace(invoice.path, destination)
+    except OSError:
+        # Cross-device moves and other rename failures use copy-and-delete.
+        shutil.move(os.fspath(invoice.path), os.fspath(destination))
+    return f"Moved {invoice.path} -> {destination}"
+
+
+def _flush_log(lines: List[str]) -> None:
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+
+
+def _extend_log(lines: List[str], messages: Iterable[str]) -> None:
+    for message in messages:
+        lines.append(message)
+        if len(lines) >= LOG_FLUSH_LINES:
+            _flush_log(lines)
+
+
+def _move_group(
+    executor: ThreadPoolExecutor, invoices: List[Invoice], destination: Path
+) -> Iterator[str]:
+    """Move ``invoices`` into ``destination`` concurrently.
+
+    Every submitted move is waited for before anything is reported, so a
+    failure never leaves moved files unlogged.  A line is yielded for each
+    completed move in the original order, then the first failure is re-raised.
+    """
 
-    destination.parent.mkdir(parents=True, exist_ok=True)
-    shutil.move(str(invoice.path), str(destination))
-    print(f"Moved {invoice.path} -> {destination}")
+    futures = [
+        executor.submit(move_invoice, invoice, destination, False, False)
+        for invoice in invoices
+    ]
+    wait(futures)
+    error: BaseException | None = None
+    for future in futures:
+        exc = future.exception()
+        if exc is None:
+            yield future.result()
+        elif error is None:
+            error = exc
+    if error is not None:
+        raise error
 
 
 def sort_invoices(
@@ -76,9 +150,31 @@ def sort_invoices(
         print(f"Source directory {source_dir} does not exist; nothing to do.")
         return
 
+    # Group invoices by vendor (in first-seen order) so each vendor directory
+    # path is built and created once and its moves happen back to back.
+    plans: Dict[str, List[Invoice]] = {}
     for invoice in iter_invoices(source_dir):
-        vendor_dir = destination_root / invoice.vendor
-        move_invoice(invoice, vendor_dir, dry_run=dry_run)
+        plans.setdefault(invoice.vendor, []).append(invoice)
+
+    log_lines: List[str] = []
+    try:
+        if dry_run:
+            for vendor, invoices in plans.items():
+                vendor_dir = destination_root / vendor
+                _extend_log(
+                    log_lines,
+                    (move_invoice(invoice, vendor_dir, dry_run=True) for invoice in invoices),
+                )
+            return
+
+        with ThreadPoolExecutor(max_workers=MOVE_WORKERS) as executor:
+            for vendor, invoices in plans.items():
+                vendor_dir = destination_root / vendor
+                # Create the directory on this thread before any worker moves into it.
+                vendor_dir.mkdir(parents=True, exist_ok=True)
+                _extend_log(log_lines, _move_group(executor, invoices, vendor_dir))
+    finally:
+        _flush_log(log_lines)
 
 
 def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace: